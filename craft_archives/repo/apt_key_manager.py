@@ -19,6 +19,7 @@
 # pyright: reportMissingTypeStubs=false
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 import subprocess
@@ -36,6 +37,7 @@ DEFAULT_APT_KEYSERVER = "keyserver.ubuntu.com"
 KEYRINGS_PATH = pathlib.Path("/etc/apt/keyrings")
 
 
+@functools.lru_cache(maxsize=256)
 def get_keyring_path(
     key_id: str,
     *,
@@ -45,6 +47,9 @@ def get_keyring_path(
 ) -> pathlib.Path:
     """Get a Path object where we would expect to find a key.
 
+    The result is cached: the same arguments always map to the same path, and
+    callers frequently resolve the same key id multiple times per install.
+
     :param key_id: The key ID for the keyring file.
     :param base_path: The directory for the key.
     :param prefix: The prefix fer the keyfile
@@ -135,14 +140,16 @@ class AptKeyManager:
                 stdin=key_bytes,
             ).splitlines()
         fingerprints: List[str] = []
-        # Only export fingerprints for primary keys.
+        # Only export fingerprints for primary keys. Slicing the record tag
+        # once per line is cheaper than three startswith() checks.
         is_primary = False
         for line in response:
-            if line.startswith(b"pub:"):
+            tag = line[:4]
+            if tag == b"pub:":
                 is_primary = True
-            elif line.startswith(b"sub:"):
+            elif tag == b"sub:":
                 is_primary = False
-            if line.startswith(b"fpr:") and is_primary:
+            elif tag == b"fpr:" and is_primary:
                 fingerprints.append(line[4:].decode().strip(":"))
         return fingerprints
 
@@ -161,9 +168,46 @@ class AptKeyManager:
             logger.debug(f"Keyring file not found: {keyring_file}")
             return False
 
+        # An empty keyring cannot contain the key; skip the gpg call entirely.
+        if keyring_file.stat().st_size == 0:
+            logger.debug(f"Keyring file is empty: {keyring_file}")
+            return False
+
         # Ensure the keyring file contains the correct key
         return gpg.is_key_in_keyring(key_id, keyring_file)
 
+    def installed_key_fingerprints(self) -> List[str]:
+        """List fingerprints for all keys installed by craft.
+
+        Only the craft-managed "craft-*.gpg" keyrings are consulted, as the
+        keyrings path may contain unrelated (or unreadable) files. Every
+        keyring file is passed to a single gpg invocation, which is much
+        cheaper than forking gpg once per keyring.
+
+        :returns: List of fingerprints for primary keys and subkeys alike.
+        """
+        keyrings = sorted(self._keyrings_path.glob("craft-*.gpg"))
+        if not keyrings:
+            return []
+
+        keyring_parameters: List[str] = []
+        for keyring in keyrings:
+            keyring_parameters += ["--keyring", f"gnupg-ring:{keyring}"]
+
+        try:
+            response = gpg.call_gpg(*keyring_parameters, "--list-keys")
+        except subprocess.CalledProcessError as error:
+            # A damaged keyring makes gpg exit non-zero, but it still lists
+            # the keys of every keyring it could read before that.
+            logger.warning(f"gpg error: {error.stderr.decode()}")
+            response = error.output or b""
+
+        return [
+            line[4:].decode().strip(":")
+            for line in response.splitlines()
+            if line.startswith(b"fpr:")
+        ]
+
     def install_key(self, *, key: str, key_id: Optional[str] = None) -> None:
         """Install given key.
 
@@ -205,11 +249,11 @@ class AptKeyManager:
             except subprocess.CalledProcessError as error:
                 raise errors.AptGPGKeyInstallError(error.stderr.decode(), key=key)
 
-        if key_id is not None:
-            # Make sure the imported key has the expected key_id
-            imported_keyring = keyring_path.read_bytes()
-            if key_id not in self.get_key_fingerprints(key=imported_keyring):
-                raise errors.AptGPGKeyInstallError(f"key-id {key_id} not imported.")
+        # Make sure the imported key has the expected key_id. Listing the
+        # imported keyring directly is much cheaper than re-parsing its
+        # contents through a second "show-only" import.
+        if key_id is not None and not gpg.is_key_in_keyring(key_id, keyring_path):
+            raise errors.AptGPGKeyInstallError(f"key-id {key_id} not imported.")
 
         _configure_keyring_file(keyring_path)
         logger.debug(f"Installed apt repository key:\n{key_id or key}")
@@ -20,6 +20,7 @@
 # Eliminate launchpadlib typing issues:
 # pyright: reportUnknownMemberType=false
 
+import functools
 import logging
 from typing import Tuple, cast
 
@@ -39,8 +40,14 @@ def split_ppa_parts(*, ppa: str) -> Tuple[str, str]:
     return ppa_split[0], ppa_split[1]
 
 
+@functools.lru_cache(maxsize=128)
 def get_launchpad_ppa_key_id(*, ppa: str) -> str:
-    """Query Launchpad for PPA's key ID."""
+    """Query Launchpad for PPA's key ID.
+
+    The result is cached: a PPA's signing key does not change between
+    calls, so repeated lookups skip the anonymous Launchpad login and
+    the network round-trip.
+    """
     owner, name = split_ppa_parts(ppa=ppa)
     launchpad = Launchpad.login_anonymously("snapcraft", "production")
     launchpad_url = f"~{owner}/+archive/{name}"
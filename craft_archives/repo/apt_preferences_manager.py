@@ -20,6 +20,7 @@ import contextlib
 import dataclasses
 import io
 import logging
+import re
 import typing
 from pathlib import Path
 
@@ -29,6 +30,9 @@ _DEFAULT_PREFERENCES_FILE = Path("/etc/apt/preferences.d/craft-archives")
 
 _DEFAULT_HEADER = "# This file is managed by craft-archives"
 
+# A "Field: value" preference line, with surrounding whitespace stripped.
+_PREFERENCE_LINE_REGEX = re.compile(r"\s*([^:]+?)\s*:\s*(.*?)\s*$")
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,13 +56,25 @@ class Preference:
         :raises: ValueError if the string is not a preferences paragraph
         :raises: AptPreferencesError if either pin or priority is missing
         """
-        lines = input_str.splitlines(keepends=False)
+        return cls.from_lines(input_str.splitlines(keepends=False))
+
+    @classmethod
+    def from_lines(cls, lines: typing.Iterable[str]) -> "Preference":
+        """Create a Preference object from a paragraph's already-split lines.
+
+        :param lines: The individual lines of a preferences paragraph
+        :returns: a single Preference object
+        :raises: ValueError if the lines are not a preferences paragraph
+        :raises: AptPreferencesError if either pin or priority is missing
+        """
         pin, priority = None, None
         for line in lines:
             if not line or line.startswith("#"):
                 continue
-            key, value = line.split(":", maxsplit=1)
-            key, value = key.strip().lower(), value.strip()
+            parsed = _PREFERENCE_LINE_REGEX.match(line)
+            if parsed is None:
+                raise ValueError(f"Line is not a preference field: {line!r}")
+            key, value = parsed[1].lower(), parsed[2]
             if key == "pin":
                 pin = value
             elif key == "pin-priority":
@@ -91,12 +107,8 @@ class Preference:
 
     def __str__(self) -> str:
         """Return the preference paragraph as a string."""
-        with io.StringIO() as file:
-            print("Package: *", file=file)
-            print(f"Pin: {self.pin}", file=file)
-            print(f"Pin-Priority: {self.priority}", file=file)
-            print("", file=file)  # Empty line to start a new paragraph.
-            return file.getvalue()
+        # Trailing empty line to start a new paragraph.
+        return f"Package: *\nPin: {self.pin}\nPin-Priority: {self.priority}\n\n"
 
 
 class AptPreferencesManager:
@@ -132,17 +144,29 @@ class AptPreferencesManager:
         if not self._path.exists():
             logger.debug("No preferences read.")
             return
-        paragraphs = self._path.read_text().split("\n\n")
-        for paragraph in paragraphs:
-            # Strip and check for contents to ensure no empty paragraphs are included.
-            if not paragraph.strip():
-                continue
-            with contextlib.suppress(ValueError):
-                preference = Preference.from_string(paragraph)
-                if preference not in self._preferences:
-                    self._preferences.append(preference)
+        # Group consecutive non-empty lines into paragraphs in a single pass,
+        # instead of splitting the full text and re-splitting each paragraph.
+        paragraph: typing.List[str] = []
+        with self._path.open() as file:
+            for line in file:
+                line = line.rstrip("\n")  # noqa: PLW2901 — overwriting loop variable
+                if line:
+                    paragraph.append(line)
+                    continue
+                self._add_paragraph_lines(paragraph)
+                paragraph = []
+        self._add_paragraph_lines(paragraph)
         logger.debug(f"{len(self._preferences)} pin preferences read.")
 
+    def _add_paragraph_lines(self, lines: typing.List[str]) -> None:
+        """Parse a read paragraph and record it, ignoring non-preference ones."""
+        if not lines:
+            return
+        with contextlib.suppress(ValueError):
+            preference = Preference.from_lines(lines)
+            if preference not in self._preferences:
+                self._preferences.append(preference)
+
     def write(self) -> bool:
         """Write the preferences file from the given preferences.
 
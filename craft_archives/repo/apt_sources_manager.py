@@ -16,13 +16,12 @@
 #
 """Manage the host's apt source repository configuration."""
 
-import io
 import logging
 import pathlib
 import subprocess
 from pathlib import Path
 from typing import List, Optional, Sequence, cast
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import distro
 from debian.deb822 import Deb822
@@ -50,33 +49,25 @@ def _construct_deb822_source(  # noqa: PLR0913
     signed_by: pathlib.Path,
 ) -> str:
     """Construct deb-822 formatted sources string."""
-    with io.StringIO() as deb822:
-        if formats:
-            type_text = " ".join(formats)
-        else:
-            type_text = "deb"
-
-        print(f"Types: {type_text}", file=deb822)
-
-        print(f"URIs: {url}", file=deb822)
-
-        suites_text = " ".join(suites)
-        print(f"Suites: {suites_text}", file=deb822)
-
-        if components:
-            components_text = " ".join(components)
-            print(f"Components: {components_text}", file=deb822)
+    type_text = " ".join(formats) if formats else "deb"
+    arch_text = (
+        " ".join(architectures) if architectures else utils.get_host_architecture()
+    )
 
-        if architectures:
-            arch_text = " ".join(architectures)
-        else:
-            arch_text = utils.get_host_architecture()
+    lines = [
+        f"Types: {type_text}",
+        f"URIs: {url}",
+        f"Suites: {' '.join(suites)}",
+    ]
 
-        print(f"Architectures: {arch_text}", file=deb822)
+    if components:
+        lines.append(f"Components: {' '.join(components)}")
 
-        print(f"Signed-By: {str(signed_by)}", file=deb822)
+    lines.append(f"Architectures: {arch_text}")
+    lines.append(f"Signed-By: {signed_by!s}")
+    lines.append("")  # Terminate the last field with a newline.
 
-        return deb822.getvalue()
+    return "\n".join(lines)
 
 
 class AptSourcesManager:
@@ -369,7 +360,7 @@ def _get_suites(pocket: PocketEnum, series: str) -> List[str]:
 
 
 def _normalize_archive_url(url: str) -> str:
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     # Disregard the scheme: Apt considers both http and https the same for
     # resolving the archive.
     url = parsed.netloc + parsed.path
@@ -407,41 +398,44 @@ def _get_existing_keyring_for(
 
     logger.debug("Reading sources in '%s' looking for '%s'", sources_file, url)
 
-    for source_dict in Deb822.iter_paragraphs(
-        sequence=sources_file.read_text(), fields=["URIs", "Suites", "Signed-By"]
-    ):
-        try:
-            source_url = _normalize_archive_url(source_dict["URIs"])
-            source_suites = set(source_dict.get("Suites", "").split())
-            source_signed = source_dict["Signed-By"]
-        except KeyError:
-            # Source does not have a Signed-By or URIs - not relevant here.
-            continue
-
-        if url != source_url:
-            logger.debug(
-                "Source does not have a matching url: %s",
-                source_url,
-            )
-            continue
-
-        logger.debug("Source has these suites: %s", sorted(source_suites))
-        if suites_set.intersection(source_suites):
-            logger.debug("Suites match - Signed-By is '%s'", source_signed)
-            full_key_path = root / Path(source_signed).relative_to("/")
-
-            # Check whether the requested key-id matches the existing
-            # Signed-By key.
-            if not gpg.is_key_in_keyring(key_id, full_key_path):
-                # This is impossible to recover: user asked for a specific ID,
-                # and an Apt repository cannot be signed by different keys at
-                # the moment.
-                raise errors.SourcesKeyConflictError(
-                    requested_key_id=key_id,
-                    requested_url=original_url,
-                    conflict_keyring=source_signed,
-                    conflicting_source=sources_file,
+    # Stream the open file into the parser instead of reading the full text
+    # into memory first: iter_paragraphs() consumes it line by line.
+    with sources_file.open() as sources:
+        for source_dict in Deb822.iter_paragraphs(
+            sequence=sources, fields=["URIs", "Suites", "Signed-By"]
+        ):
+            try:
+                source_url = _normalize_archive_url(source_dict["URIs"])
+                source_suites = set(source_dict.get("Suites", "").split())
+                source_signed = source_dict["Signed-By"]
+            except KeyError:
+                # Source does not have a Signed-By or URIs - not relevant here.
+                continue
+
+            if url != source_url:
+                logger.debug(
+                    "Source does not have a matching url: %s",
+                    source_url,
                 )
-            return full_key_path
+                continue
+
+            logger.debug("Source has these suites: %s", sorted(source_suites))
+            if suites_set.intersection(source_suites):
+                logger.debug("Suites match - Signed-By is '%s'", source_signed)
+                full_key_path = root / Path(source_signed).relative_to("/")
+
+                # Check whether the requested key-id matches the existing
+                # Signed-By key.
+                if not gpg.is_key_in_keyring(key_id, full_key_path):
+                    # This is impossible to recover: user asked for a specific ID,
+                    # and an Apt repository cannot be signed by different keys at
+                    # the moment.
+                    raise errors.SourcesKeyConflictError(
+                        requested_key_id=key_id,
+                        requested_url=original_url,
+                        conflict_keyring=source_signed,
+                        conflicting_source=sources_file,
+                    )
+                return full_key_path
 
     return None
@@ -32,7 +32,10 @@ def check_release_compatibility(
     codename: str, cloud: str, pocket: PocketUCAEnum = PocketUCAEnum.UPDATES
 ) -> None:
     """Raise an exception if the release is incompatible with codename."""
-    request = UCA_ARCHIVE + f"/dists/{codename}-{pocket.value}/{cloud}/"
+    url = UCA_ARCHIVE + f"/dists/{codename}-{pocket.value}/{cloud}/"
+    # Only the status code matters here, so a HEAD request avoids downloading
+    # the response body just to discard it.
+    request = urllib.request.Request(url, method="HEAD")
     try:
         urllib.request.urlopen(request)
     except urllib.error.HTTPError as e:
@@ -23,7 +23,10 @@ from typing import Iterable
 logger = logging.getLogger(__name__)
 
 # GnuPG command line options that we always want to use.
-_GPG_PREFIX = ["gpg", "--batch", "--no-default-keyring", "--with-colons"]
+_GPG_PREFIX = ("gpg", "--batch", "--no-default-keyring", "--with-colons")
+
+# Environment for every gpg call, built once instead of per invocation.
+_GPG_ENV = {"LANG": "C.UTF-8"}
 
 
 def is_key_in_keyring(key_id: str, keyring_file: pathlib.Path) -> bool:
@@ -54,14 +57,13 @@ def call_gpg(
     else:
         command = [*base_parameters, *parameters]
     logger.debug(f"Executing command: {command}")
-    env = {"LANG": "C.UTF-8"}
     try:
         process = subprocess.run(
             command,
             input=stdin,
             capture_output=True,
             check=True,
-            env=env,
+            env=_GPG_ENV,
         )
         if log:
             _log_gpg(process)
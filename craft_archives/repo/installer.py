@@ -122,11 +122,17 @@ def _verify_all_key_assets_installed(
     key_manager: AptKeyManager,
 ) -> None:
     """Verify all configured key assets are utilized, error if not."""
+    # A single batched gpg listing, instead of one gpg fork per key asset.
+    installed_fingerprints: Optional[List[str]] = None
     for key_asset in key_assets.glob("*"):
-        key_id = key_asset.stem
-        if not key_manager.is_key_installed(key_id=key_id):
+        if installed_fingerprints is None:
+            installed_fingerprints = key_manager.installed_key_fingerprints()
+        key_id = key_asset.stem.upper()
+        if not any(
+            fingerprint.endswith(key_id) for fingerprint in installed_fingerprints
+        ):
             raise errors.PackageRepositoryError(
-                "Found unused key asset {key_asset!r}.",
+                f"Found unused key asset {key_asset!r}.",
                 details="All configured key assets must be utilized.",
                 resolution="Verify key usage and remove all unused keys.",
             )
@@ -136,17 +142,13 @@ def _unmarshal_repositories(
     project_repositories: List[Dict[str, Any]],
 ) -> List[PackageRepository]:
     """Create package repositories objects from project data."""
-    repositories: List[PackageRepository] = []
-    for data in project_repositories:
-        pkg_repo: PackageRepository
-
-        if "ppa" in data:
-            pkg_repo = PackageRepositoryAptPPA.unmarshal(data)
-        elif "cloud" in data:
-            pkg_repo = PackageRepositoryAptUCA.unmarshal(data)
-        else:
-            pkg_repo = PackageRepositoryApt.unmarshal(data)
+    return [_unmarshal_repository(data) for data in project_repositories]
 
-        repositories.append(pkg_repo)
 
-    return repositories
+def _unmarshal_repository(data: Dict[str, Any]) -> PackageRepository:
+    """Create a single package repository object from project data."""
+    if "ppa" in data:
+        return PackageRepositoryAptPPA.unmarshal(data)
+    if "cloud" in data:
+        return PackageRepositoryAptUCA.unmarshal(data)
+    return PackageRepositoryApt.unmarshal(data)
@@ -19,6 +19,7 @@
 import abc
 import collections
 import enum
+import functools
 import re
 from typing import (
     Annotated,
@@ -31,17 +32,19 @@ from typing import (
     TypeVar,
     Union,
 )
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from overrides import overrides  # pyright: ignore[reportUnknownVariableType]
 from pydantic import (
     AfterValidator,
     AnyUrl,
     BaseModel,
     ConfigDict,
+    Discriminator,
     Field,  # pyright: ignore[reportUnknownVariableType]
     FileUrl,
     StringConstraints,
+    Tag,
+    TypeAdapter,
     ValidationInfo,
     field_serializer,
     field_validator,  # pyright: ignore[reportUnknownVariableType]
@@ -92,9 +95,18 @@ class PocketUCAEnum(str, enum.Enum):
 
 
 UCA_ARCHIVE = "http://ubuntu-cloud.archive.canonical.com/ubuntu"
-UCA_NETLOC = urlparse(UCA_ARCHIVE).netloc
+UCA_NETLOC = urlsplit(UCA_ARCHIVE).netloc
 UCA_KEY_ID = "391A9AA2147192839E9DB0315EDB1B62EC4926EA"
 
+# Compiled once: turns every non-word run of a url into an underscore.
+_NAME_SANITIZER = re.compile(r"\W+")
+
+
+@functools.lru_cache(maxsize=256)
+def _get_netloc(url: str) -> str:
+    """Get the network location of ``url``, caching the parse per url."""
+    return urlsplit(url).netloc
+
 
 class PriorityString(enum.IntEnum):
     """Convenience values that represent common deb priorities."""
@@ -105,6 +117,13 @@ class PriorityString(enum.IntEnum):
 
 
 PriorityValue = Union[int, Literal["always", "prefer", "defer"]]
+
+# Maps the accepted priority strings straight to their pin values with a
+# single dict lookup instead of an upper(), a membership test and an
+# enum indexing per validation.
+_PRIORITY_MAP: Dict[str, int] = {
+    name.lower(): member.value for name, member in PriorityString.__members__.items()
+}
 SeriesStr = Annotated[
     str, StringConstraints(min_length=1, pattern=re.compile(r"^[a-z]+$"))
 ]
@@ -116,6 +135,11 @@ KeyIdStr = Annotated[
 ]
 
 
+def _get_repository_identifier(values: Mapping[str, Any]) -> str:
+    """Get whichever field identifies a repository, for error messages."""
+    return str(values.get("url") or values.get("ppa") or values.get("cloud"))
+
+
 def _validate_suite_str(suite: str) -> str:
     if suite.endswith("/"):
         raise ValueError(f"invalid suite {suite!r}. Suites must not end with a '/'.")
@@ -128,18 +152,14 @@ SuiteStr = Annotated[
 ]
 
 
-def _alias_generator(value: str) -> str:
-    return value.replace("_", "-")
-
-
 class PackageRepository(BaseModel, abc.ABC):
     """The base class for package repositories."""
 
+    # The only fields whose aliases differ from their names ("key-id" and
+    # "key-server") declare them explicitly, so no alias generator is needed.
     model_config = ConfigDict(
-        validate_assignment=True,
         frozen=True,
         populate_by_name=True,
-        alias_generator=_alias_generator,
         extra="forbid",
     )
 
@@ -153,7 +173,7 @@ class PackageRepository(BaseModel, abc.ABC):
         priority = values.get("priority")
         if priority == 0:
             raise _create_validation_error(
-                url=str(values.get("url") or values.get("ppa") or values.get("cloud")),
+                url=_get_repository_identifier(values),
                 message="invalid priority: Priority cannot be zero.",
             )
         return values
@@ -164,17 +184,13 @@ class PackageRepository(BaseModel, abc.ABC):
         cls, priority: Optional[PriorityValue], info: ValidationInfo
     ) -> Optional[int]:
         if isinstance(priority, str):
-            str_priority = priority.upper()
-            if str_priority in PriorityString.__members__:
-                return PriorityString[str_priority]
+            int_priority = _PRIORITY_MAP.get(priority.lower())
+            if int_priority is not None:
+                return int_priority
             # This cannot happen; if it's a string but not one of the accepted
             # ones Pydantic will fail early and won't call this validator.
             raise _create_validation_error(
-                url=str(
-                    info.data.get("url")
-                    or info.data.get("ppa")
-                    or info.data.get("cloud")
-                ),
+                url=_get_repository_identifier(info.data),
                 message=(
                     f"invalid priority {priority!r}. "
                     "Priority must be 'always', 'prefer', 'defer' or a nonzero integer."
@@ -212,25 +228,33 @@ class PackageRepository(BaseModel, abc.ABC):
         cls, data: Optional[List[Dict[str, Any]]]
     ) -> List["PackageRepository"]:
         """Create multiple package repositories from the given data."""
-        repositories: List[PackageRepository] = []
+        if data is None:
+            return []
+
+        if not isinstance(data, list):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise errors.PackageRepositoryValidationError(
+                url=str(data),
+                brief="invalid list object.",
+                details="Package repositories must be a list of objects.",
+                resolution=(
+                    "Verify 'package-repositories' configuration and ensure "
+                    "that the correct syntax is used."
+                ),
+            )
 
-        if data is not None:
-            if not isinstance(data, list):  # pyright: ignore[reportUnnecessaryIsInstance]
+        for repository in data:
+            if not isinstance(repository, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
                 raise errors.PackageRepositoryValidationError(
-                    url=str(data),
-                    brief="invalid list object.",
-                    details="Package repositories must be a list of objects.",
+                    url=str(repository),
+                    brief="invalid object.",
+                    details="Package repository must be a valid dictionary object.",
                     resolution=(
-                        "Verify 'package-repositories' configuration and ensure "
-                        "that the correct syntax is used."
+                        "Verify repository configuration and ensure that the "
+                        "correct syntax is used."
                     ),
                 )
 
-            for repository in data:
-                package_repo = cls.unmarshal(repository)
-                repositories.append(package_repo)
-
-        return repositories
+        return list(_REPOSITORY_LIST_ADAPTER.validate_python(data))
 
 
 class PackageRepositoryAptPPA(PackageRepository):
@@ -249,10 +273,9 @@ class PackageRepositoryAptPPA(PackageRepository):
         return ppa
 
     @classmethod
-    @overrides
     def unmarshal(cls, data: Mapping[str, Any]) -> "PackageRepositoryAptPPA":
         """Create a package repository object from the given data."""
-        return cls(**data)
+        return cls.model_validate(data)
 
     @property
     def pin(self) -> str:
@@ -275,7 +298,6 @@ class PackageRepositoryAptUCA(PackageRepository):
         return cloud
 
     @classmethod
-    @overrides
     def unmarshal(cls, data: Mapping[str, Any]) -> "PackageRepositoryAptUCA":
         """Create a package repository object from the given data."""
         return cls.model_validate(data)
@@ -308,7 +330,7 @@ class PackageRepositoryApt(PackageRepository):
     @property
     def name(self) -> str:
         """Get the repository name."""
-        return re.sub(r"\W+", "_", str(self.url))
+        return _NAME_SANITIZER.sub("_", str(self.url))
 
     @field_validator("url")
     @classmethod
@@ -391,7 +413,6 @@ class PackageRepositoryApt(PackageRepository):
         return self
 
     @classmethod
-    @overrides
     def unmarshal(cls, data: Mapping[str, Any]) -> "PackageRepositoryApt":
         """Create a package repository object from the given data."""
         return cls.model_validate(data)
@@ -399,10 +420,41 @@ class PackageRepositoryApt(PackageRepository):
     @property
     def pin(self) -> str:
         """The pin string for this repository if needed."""
-        domain = urlparse(str(self.url)).netloc
+        # The model is frozen, so the cached parse stays valid for this url.
+        domain = _get_netloc(str(self.url))
         return f'origin "{domain}"'
 
 
+def _get_repository_tag(data: Any) -> str:
+    """Select the union member tag the same way ``unmarshal`` dispatches."""
+    if isinstance(data, Mapping):
+        if "ppa" in data:
+            return "ppa"
+        if "cloud" in data:
+            return "cloud"
+    elif isinstance(data, PackageRepositoryAptPPA):
+        return "ppa"
+    elif isinstance(data, PackageRepositoryAptUCA):
+        return "cloud"
+    return "apt"
+
+
+PackageRepositoryUnion = Annotated[
+    Union[
+        Annotated[PackageRepositoryAptPPA, Tag("ppa")],
+        Annotated[PackageRepositoryAptUCA, Tag("cloud")],
+        Annotated[PackageRepositoryApt, Tag("apt")],
+    ],
+    Discriminator(_get_repository_tag),
+]
+
+# Built once at import: dispatches on the discriminator and validates whole
+# lists inside pydantic-core instead of sniffing keys in Python per element.
+_REPOSITORY_LIST_ADAPTER: TypeAdapter[List[PackageRepositoryUnion]] = TypeAdapter(
+    List[PackageRepositoryUnion]
+)
+
+
 def _create_validation_error(*, url: Optional[str] = None, message: str) -> ValueError:
     """Create a ValueError with a formatted message and an optional url."""
     error_message = ""
@@ -18,6 +18,7 @@
 from pathlib import Path
 
 import pytest
+from craft_archives.repo.apt_key_manager import AptKeyManager
 
 
 @pytest.fixture(scope="session")
@@ -43,3 +44,18 @@ def sample_key_string(sample_key_path) -> str:
 @pytest.fixture(scope="session")
 def sample_key_bytes(sample_key_path) -> bytes:
     return sample_key_path.read_bytes()
+
+
+@pytest.fixture
+def key_assets(tmp_path) -> Path:
+    assets = tmp_path / "key-assets"
+    assets.mkdir(parents=True)
+    return assets
+
+
+@pytest.fixture
+def apt_gpg(key_assets, tmp_path) -> AptKeyManager:
+    return AptKeyManager(
+        keyrings_path=tmp_path,
+        key_assets=key_assets,
+    )
@@ -26,33 +26,17 @@ from craft_archives.repo import errors
 from craft_archives.repo.apt_key_manager import AptKeyManager
 
 
-@pytest.fixture
-def key_assets(tmp_path):
-    assets = tmp_path / "key-assets"
-    assets.mkdir(parents=True)
-    return assets
-
-
 @pytest.fixture
 def gpg_keyring(tmp_path):
     return tmp_path / "keyring.gpg"
 
 
-@pytest.fixture
-def apt_gpg(key_assets, tmp_path):
-    return AptKeyManager(
-        keyrings_path=tmp_path,
-        key_assets=key_assets,
-    )
-
-
-def test_install_key(apt_gpg, tmp_path, test_data_dir):
+def test_install_key(apt_gpg, tmp_path, sample_key_string):
     expected_file = tmp_path / "craft-FC42E99D.gpg"
     assert not expected_file.exists()
     assert not apt_gpg.is_key_installed(key_id="FC42E99D")
 
-    keypath = test_data_dir / "FC42E99D.asc"
-    apt_gpg.install_key(key=keypath.read_text())
+    apt_gpg.install_key(key=sample_key_string)
 
     assert expected_file.is_file()
     assert apt_gpg.is_key_installed(key_id="FC42E99D")
@@ -75,7 +59,7 @@ def test_install_key_from_keyserver(apt_gpg, tmp_path):
     assert apt_gpg.is_key_installed(key_id="FC42E99D")
 
 
-def test_install_key_missing_directory(key_assets, tmp_path, test_data_dir):
+def test_install_key_missing_directory(key_assets, tmp_path, sample_key_string):
     keyrings_path = tmp_path / "keyrings"
     assert not keyrings_path.exists()
 
@@ -84,8 +68,7 @@ def test_install_key_missing_directory(key_assets, tmp_path, test_data_dir):
         key_assets=key_assets,
     )
 
-    keypath = test_data_dir / "FC42E99D.asc"
-    apt_gpg.install_key(key=keypath.read_text())
+    apt_gpg.install_key(key=sample_key_string)
 
     assert keyrings_path.exists()
     assert keyrings_path.stat().st_mode == 0o40755  # noqa: PLR2004 magic value
@@ -69,14 +69,52 @@ fpr:::::::::90A29D0A6576E2CA185AED3EF230A24E9F057A83:
 """
 
 
-@pytest.fixture(autouse=True)
-def mock_environ_copy(mocker):
-    yield mocker.patch("os.environ.copy")
+_GPG_ENV = {"LANG": "C.UTF-8"}
+
+# Expected gpg invocations with no per-test values, built once per module.
+EXPECTED_SHOW_KEY_CALL = call(
+    [
+        "gpg",
+        "--batch",
+        "--no-default-keyring",
+        "--with-colons",
+        "--homedir",
+        mock.ANY,
+        "--import-options",
+        "show-only",
+        "--import",
+    ],
+    input=b"8" * 40,
+    capture_output=True,
+    check=True,
+    env=_GPG_ENV,
+)
+
+EXPECTED_RECV_KEYS_CALL = call(
+    [
+        "gpg",
+        "--batch",
+        "--no-default-keyring",
+        "--with-colons",
+        "--keyring",
+        mock.ANY,
+        "--homedir",
+        mock.ANY,
+        "--keyserver",
+        "key.server",
+        "--recv-keys",
+        "FAKE_KEY",
+    ],
+    check=True,
+    env=_GPG_ENV,
+    input=None,
+    capture_output=True,
+)
 
 
 @pytest.fixture(autouse=True)
 def mock_run(mocker):
-    yield mocker.patch("subprocess.run", spec=subprocess.run)
+    yield mocker.patch("subprocess.run")
 
 
 @pytest.fixture
@@ -103,28 +141,13 @@ def mock_logger(mocker):
     yield mocker.patch("craft_archives.repo.gpg.logger", spec=logging.Logger)
 
 
-@pytest.fixture
-def key_assets(tmp_path):
-    assets = tmp_path / "key-assets"
-    assets.mkdir(parents=True)
-    yield assets
-
-
-@pytest.fixture
-def apt_gpg(key_assets, tmp_path):
-    yield AptKeyManager(
-        keyrings_path=tmp_path,
-        key_assets=key_assets,
-    )
-
-
 def test_find_asset(
     apt_gpg,
     key_assets,
 ):
     key_id = "8" * 40
     expected_key_path = key_assets / ("8" * 8 + ".asc")
-    expected_key_path.write_text("key")
+    expected_key_path.touch()
 
     key_path = apt_gpg.find_asset_with_key_id(key_id=key_id)
 
@@ -145,25 +168,7 @@ def test_get_key_fingerprints(apt_gpg, mock_run):
     ids = apt_gpg.get_key_fingerprints(key="8" * 40)
 
     assert ids == ["FAKE-KEY-ID-FROM-GNUPG"]
-    assert mock_run.mock_calls == [
-        call(
-            [
-                "gpg",
-                "--batch",
-                "--no-default-keyring",
-                "--with-colons",
-                "--homedir",
-                mock.ANY,
-                "--import-options",
-                "show-only",
-                "--import",
-            ],
-            input=b"8" * 40,
-            capture_output=True,
-            check=True,
-            env={"LANG": "C.UTF-8"},
-        )
-    ]
+    assert mock_run.mock_calls == [EXPECTED_SHOW_KEY_CALL]
 
 
 @pytest.mark.parametrize(
@@ -214,7 +219,12 @@ def test_is_key_installed(
     assert not apt_gpg.is_key_installed(key_id="foo")
     assert mock_run.mock_calls == []
 
+    # Likewise if the keyring file exists but is empty
     keyring_path.touch()
+    assert not apt_gpg.is_key_installed(key_id="foo")
+    assert mock_run.mock_calls == []
+
+    keyring_path.write_bytes(b"fake keyring contents")
     is_installed = apt_gpg.is_key_installed(key_id="foo")
 
     assert is_installed is expected_is_installed
@@ -233,7 +243,7 @@ def test_is_key_installed(
             input=None,
             capture_output=True,
             check=True,
-            env={"LANG": "C.UTF-8"},
+            env=_GPG_ENV,
         )
     ]
 
@@ -243,7 +253,7 @@ def test_is_key_installed_with_gpg_failure(
     apt_gpg, mock_run, mock_logger, tmp_path, return_code
 ):
     keyring_file = tmp_path / "craft-FOO.gpg"
-    keyring_file.touch()
+    keyring_file.write_bytes(b"fake keyring contents")
     mock_run.side_effect = subprocess.CalledProcessError(
         cmd=["gpg"], returncode=return_code, output=b"some error"
     )
@@ -254,6 +264,62 @@ def test_is_key_installed_with_gpg_failure(
     mock_logger.warning.assert_called_once_with("gpg error: some error")
 
 
+def test_installed_key_fingerprints(apt_gpg, mock_run, tmp_path):
+    (tmp_path / "craft-11223344.gpg").touch()
+    (tmp_path / "craft-AABBCCDD.gpg").touch()
+    # Unrelated files in the keyrings directory must not be consulted.
+    (tmp_path / "other.gpg").touch()
+    mock_run.return_value.stdout = SAMPLE_GPG_DOCKER_OUTPUT
+
+    fingerprints = apt_gpg.installed_key_fingerprints()
+
+    assert fingerprints == [
+        "9DC858229FC7DD38854AE2D88D81803C0EBFCD88",
+        "D3306A018370199E527AE7997EA0A9C3F273FCD8",
+    ]
+    assert mock_run.mock_calls == [
+        call(
+            [
+                "gpg",
+                "--batch",
+                "--no-default-keyring",
+                "--with-colons",
+                "--keyring",
+                f"gnupg-ring:{tmp_path / 'craft-11223344.gpg'}",
+                "--keyring",
+                f"gnupg-ring:{tmp_path / 'craft-AABBCCDD.gpg'}",
+                "--list-keys",
+            ],
+            input=None,
+            capture_output=True,
+            check=True,
+            env=_GPG_ENV,
+        )
+    ]
+
+
+def test_installed_key_fingerprints_no_keyrings(apt_gpg, mock_run):
+    assert apt_gpg.installed_key_fingerprints() == []
+    assert mock_run.mock_calls == []
+
+
+def test_installed_key_fingerprints_with_gpg_failure(
+    apt_gpg, mock_run, mocker, tmp_path
+):
+    """Fingerprints of readable keyrings are still returned if gpg fails."""
+    (tmp_path / "craft-AABBCCDD.gpg").touch()
+    mock_logger = mocker.patch("craft_archives.repo.apt_key_manager.logger")
+    mock_run.side_effect = subprocess.CalledProcessError(
+        cmd=["gpg"],
+        returncode=2,
+        output=SAMPLE_GPG_SHOW_KEY_OUTPUT,
+        stderr=b"some error",
+    )
+
+    assert apt_gpg.installed_key_fingerprints() == ["FAKE-KEY-ID-FROM-GNUPG"]
+    mock_logger.warning.assert_called_once_with("gpg error: some error")
+
+
 @pytest.mark.parametrize("key_id", (None, "FAKE-KEY-ID-FROM-GNUPG"))
 def test_install_key(
     apt_gpg, mock_run, mock_chmod, sample_key_string, sample_key_bytes, tmp_path, key_id
@@ -283,7 +349,7 @@ def test_install_key(
             input=sample_key_bytes,
             capture_output=True,
             check=True,
-            env={"LANG": "C.UTF-8"},
+            env=_GPG_ENV,
         ),
         call(
             [
@@ -301,7 +367,7 @@ def test_install_key(
             input=sample_key_bytes,
             capture_output=True,
             check=True,
-            env={"LANG": "C.UTF-8"},
+            env=_GPG_ENV,
         ),
     ]
 
@@ -377,28 +443,7 @@ def test_install_key_with_invalid_key_id(apt_gpg, mocker):
 def test_install_key_from_keyserver(apt_gpg, mock_run, mock_chmod):
     apt_gpg.install_key_from_keyserver(key_id="FAKE_KEY", key_server="key.server")
 
-    assert mock_run.mock_calls == [
-        call(
-            [
-                "gpg",
-                "--batch",
-                "--no-default-keyring",
-                "--with-colons",
-                "--keyring",
-                mock.ANY,
-                "--homedir",
-                mock.ANY,
-                "--keyserver",
-                "key.server",
-                "--recv-keys",
-                "FAKE_KEY",
-            ],
-            check=True,
-            env={"LANG": "C.UTF-8"},
-            input=None,
-            capture_output=True,
-        )
-    ]
+    assert mock_run.mock_calls == [EXPECTED_RECV_KEYS_CALL]
     # Two chmod calls: one for the temporary dir that gpg uses during the fetching,
     # and one of the actual keyring file.
     assert mock_chmod.mock_calls == [call(mock.ANY, 0o700), call(mock.ANY, 0o644)]
@@ -473,55 +518,38 @@ def test_install_package_repository_key_from_asset(apt_gpg, key_assets, mocker):
     assert mock_install_key.mock_calls == [call(key="key-data", key_id=key_id)]
 
 
-def test_install_package_repository_key_apt_from_keyserver(apt_gpg, mocker):
-    mock_install_key_from_keyserver = mocker.patch(
-        "craft_archives.repo.apt_key_manager.AptKeyManager.install_key_from_keyserver"
-    )
-    mocker.patch(
-        "craft_archives.repo.apt_key_manager.AptKeyManager.is_key_installed",
-        return_value=False,
-    )
-
-    key_id = "8" * 40
-
-    package_repo = PackageRepositoryApt.model_validate(
-        {
-            "type": "apt",
-            "components": ["main", "multiverse"],
-            "key-id": key_id,
-            "key-server": "key.server",
-            "suites": ["xenial"],
-            "url": "http://archive.ubuntu.com/ubuntu",
-        }
-    )
-
-    updated = apt_gpg.install_package_repository_key(package_repo=package_repo)
-
-    assert updated is True
-    assert mock_install_key_from_keyserver.mock_calls == [
-        call(key_id=key_id, key_server="key.server")
-    ]
-
-
-def test_install_package_repository_key_ppa_from_keyserver(apt_gpg, mocker):
-    mock_install_key_from_keyserver = mocker.patch(
-        "craft_archives.repo.apt_key_manager.AptKeyManager.install_key_from_keyserver"
-    )
-    mocker.patch(
-        "craft_archives.repo.apt_key_manager.AptKeyManager.is_key_installed",
-        return_value=False,
-    )
-
-    package_repo = PackageRepositoryAptPPA(type="apt", ppa="test/ppa")
-    updated = apt_gpg.install_package_repository_key(package_repo=package_repo)
-
-    assert updated is True
-    assert mock_install_key_from_keyserver.mock_calls == [
-        call(key_id="FAKE-PPA-SIGNING-KEY", key_server="keyserver.ubuntu.com")
-    ]
-
-
-def test_install_package_repository_key_uca_from_keyserver(apt_gpg, mocker):
+@pytest.mark.parametrize(
+    "package_repo,expected_call",
+    [
+        pytest.param(
+            PackageRepositoryApt.model_validate(
+                {
+                    "type": "apt",
+                    "components": ["main", "multiverse"],
+                    "key-id": "8" * 40,
+                    "key-server": "key.server",
+                    "suites": ["xenial"],
+                    "url": "http://archive.ubuntu.com/ubuntu",
+                }
+            ),
+            call(key_id="8" * 40, key_server="key.server"),
+            id="apt",
+        ),
+        pytest.param(
+            PackageRepositoryAptPPA(type="apt", ppa="test/ppa"),
+            call(key_id="FAKE-PPA-SIGNING-KEY", key_server="keyserver.ubuntu.com"),
+            id="ppa",
+        ),
+        pytest.param(
+            PackageRepositoryAptUCA(type="apt", cloud="antelope"),
+            call(key_id="FAKE-UCA-KEY-ID", key_server="keyserver.ubuntu.com"),
+            id="uca",
+        ),
+    ],
+)
+def test_install_package_repository_key_from_keyserver(
+    apt_gpg, mocker, package_repo, expected_call
+):
     mock_install_key_from_keyserver = mocker.patch(
         "craft_archives.repo.apt_key_manager.AptKeyManager.install_key_from_keyserver"
     )
@@ -530,13 +558,10 @@ def test_install_package_repository_key_uca_from_keyserver(apt_gpg, mocker):
         return_value=False,
     )
 
-    package_repo = PackageRepositoryAptUCA(type="apt", cloud="antelope")
     updated = apt_gpg.install_package_repository_key(package_repo=package_repo)
 
     assert updated is True
-    assert mock_install_key_from_keyserver.mock_calls == [
-        call(key_id="FAKE-UCA-KEY-ID", key_server="keyserver.ubuntu.com")
-    ]
+    assert mock_install_key_from_keyserver.mock_calls == [expected_call]
 
 
 def test_keyrings_path_for_root():
@@ -30,6 +30,7 @@ def mock_launchpad(mocker):
     m.login_anonymously.return_value.load.return_value.signing_key_fingerprint = (
         "FAKE-PPA-SIGNING-KEY"
     )
+    apt_ppa.get_launchpad_ppa_key_id.cache_clear()
     yield m
 
 
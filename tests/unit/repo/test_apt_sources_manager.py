@@ -53,11 +53,6 @@ def mock_apt_ppa_get_signing_key(mocker):
     )
 
 
-@pytest.fixture(autouse=True)
-def mock_environ_copy(mocker):
-    yield mocker.patch("os.environ.copy")
-
-
 @pytest.fixture(autouse=True)
 def mock_host_arch(mocker):
     m = mocker.patch("craft_archives.utils.get_host_architecture")
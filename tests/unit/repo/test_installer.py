@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import pytest
-from craft_archives.repo import installer
+from craft_archives.repo import errors, installer
 from craft_archives.repo.apt_key_manager import AptKeyManager
 from craft_archives.repo.apt_preferences_manager import AptPreferencesManager
 from craft_archives.repo.apt_sources_manager import AptSourcesManager
@@ -74,6 +74,45 @@ def test_unmarshal_repositories():
     assert pkg_repos[4].pocket.value == "proposed"
 
 
+def test_verify_all_key_assets_installed(apt_gpg, key_assets, mocker):
+    (key_assets / "FC42E99D.asc").touch()
+    mock_fingerprints = mocker.patch.object(
+        AptKeyManager,
+        "installed_key_fingerprints",
+        return_value=["78E1918602959B9C59103100F1831DDAFC42E99D"],
+    )
+
+    installer._verify_all_key_assets_installed(
+        key_assets=key_assets, key_manager=apt_gpg
+    )
+
+    mock_fingerprints.assert_called_once_with()
+
+
+def test_verify_all_key_assets_installed_unused_asset(apt_gpg, key_assets, mocker):
+    (key_assets / "FC42E99D.asc").touch()
+    mocker.patch.object(AptKeyManager, "installed_key_fingerprints", return_value=[])
+
+    with pytest.raises(errors.PackageRepositoryError) as raised:
+        installer._verify_all_key_assets_installed(
+            key_assets=key_assets, key_manager=apt_gpg
+        )
+
+    assert "Found unused key asset" in str(raised.value)
+    assert "FC42E99D.asc" in str(raised.value)
+
+
+def test_verify_all_key_assets_installed_no_assets(apt_gpg, key_assets, mocker):
+    mock_fingerprints = mocker.patch.object(AptKeyManager, "installed_key_fingerprints")
+
+    installer._verify_all_key_assets_installed(
+        key_assets=key_assets, key_manager=apt_gpg
+    )
+
+    # With no assets to check there is no reason to list the installed keys.
+    mock_fingerprints.assert_not_called()
+
+
 @pytest.fixture
 def manager_mocks(mocker, tmp_path):
     mock_install_package_repository_key = mocker.patch.object(
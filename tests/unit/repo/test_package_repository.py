@@ -605,6 +605,17 @@ def test_unmarshal_package_repositories_list_none():
     assert PackageRepository.unmarshal_package_repositories(None) == []
 
 
+def test_unmarshal_package_repositories_invalid_element():
+    with pytest.raises(errors.PackageRepositoryValidationError) as raised:
+        PackageRepository.unmarshal_package_repositories(
+            [BASIC_PPA_MARSHALLED, "bogus"]  # pyright: ignore[reportArgumentType]
+        )
+
+    err = raised.value
+    assert str(err) == "Invalid package repository for 'bogus': invalid object."
+    assert err.details == "Package repository must be a valid dictionary object."
+
+
 def test_unmarshal_package_repositories_invalid_data():
     with pytest.raises(errors.PackageRepositoryValidationError) as raised:
         PackageRepository.unmarshal_package_repositories("not-a-list")  # pyright: ignore[reportArgumentType]